@@ -15,136 +15,110 @@ Usage:
 from __future__ import annotations
 
 import html
-
-from models import GameDesignDocument
+import re
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from enum import Enum
+from functools import lru_cache
+from itertools import cycle, islice
+
+from models import GameDesignDocument, Severity
 from task_details import (
     generate_task_details_html,
     generate_sidebar_checklist_with_links,
     generate_smooth_scroll_js,
 )
 
-# Module-level constants
-CORE_LOOP_COLORS = ["#e94560", "#00d9ff", "#06d6a0", "#ef8354"]
-
-
-def _escape(text: str) -> str:
-    """Escape HTML special characters."""
-    return html.escape(str(text))
-
-
-def _escape_mermaid(text: str) -> str:
-    """Escape text for use in Mermaid diagrams."""
-    # Remove or escape characters that break Mermaid syntax
-    text = str(text)
-    text = text.replace('"', "'")
-    text = text.replace("[", "(")
-    text = text.replace("]", ")")
-    text = text.replace("{", "(")
-    text = text.replace("}", ")")
-    text = text.replace("<", "‹")
-    text = text.replace(">", "›")
-    text = text.replace("#", "")
-    text = text.replace("&", "and")
-    return text
-
-
-def _generate_core_loop_mermaid(gdd: "GameDesignDocument") -> str:
-    """Generate a Mermaid flowchart for the core gameplay loop."""
-    if not hasattr(gdd, "core_loop") or not gdd.core_loop:
-        return ""
-    loop = gdd.core_loop
-    actions = loop.primary_actions
-
-    if len(actions) < 2:
-        return ""
-
-    # Build the flowchart
-    lines = ["flowchart LR"]
-
-    # Create nodes with styled boxes
-    for i, action in enumerate(actions):
-        node_id = f"A{i}"
-        action_text = _escape_mermaid(action)
-        lines.append(f'    {node_id}["{action_text}"]')
-
-    # Connect nodes in sequence
-    for i in range(len(actions) - 1):
-        lines.append(f"    A{i} --> A{i + 1}")
 
-    # Close the loop (connect last to first)
-    lines.append(f"    A{len(actions) - 1} --> A0")
+def _minify_css(css: str) -> str:
+    """Strip comments, insignificant whitespace and final semicolons from CSS."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-    # Add styling
-    lines.append("")
-    lines.append("    %% Styling")
-    for i in range(len(actions)):
-        color_idx = i % len(CORE_LOOP_COLORS)
-        lines.append(
-            f"    style A{i} fill:{CORE_LOOP_COLORS[color_idx]},stroke:#fff,stroke-width:2px,color:#fff"
-        )
-
-    return "\n".join(lines)
-
-
-def _generate_systems_mermaid(gdd: "GameDesignDocument") -> str:
-    """Generate a Mermaid diagram showing game system relationships."""
-    if not hasattr(gdd, "systems") or not gdd.systems:
-        return ""
-    systems = gdd.systems
 
-    if len(systems) < 2:
-        return ""
-
-    lines = ["flowchart TB"]
-
-    # Create a map of system names to IDs
-    system_ids = {}
-    for i, system in enumerate(systems):
-        system_ids[system.name.lower()] = f"S{i}"
-
-    # Add system nodes with their types
-    for i, system in enumerate(systems):
-        node_id = f"S{i}"
-        name = _escape_mermaid(system.name)
-        sys_type = system.type.value.replace("_", " ").title()
-        lines.append(f'    {node_id}["{name}<br/><small>{sys_type}</small>"]')
-
-    # Add dependencies as edges
-    for i, system in enumerate(systems):
-        node_id = f"S{i}"
-        for dep in system.dependencies:
-            dep_lower = dep.lower()
-            # Try to find matching system (case-insensitive exact match)
-            for sys_name, dep_id in system_ids.items():
-                if dep_lower == sys_name.lower():
-                    lines.append(f"    {dep_id} --> {node_id}")
-                    break
+# Module-level constants
+CORE_LOOP_COLORS = ("#e94560", "#00d9ff", "#06d6a0", "#ef8354")
 
-    # Style based on priority
-    lines.append("")
-    lines.append("    %% Priority-based styling")
-    for i, system in enumerate(systems):
-        node_id = f"S{i}"
-        priority = system.priority
-        if priority <= 2:
-            lines.append(
-                f"    style {node_id} fill:#e94560,stroke:#fff,stroke-width:3px,color:#fff"
-            )
-        elif priority <= 4:
-            lines.append(
-                f"    style {node_id} fill:#00d9ff,stroke:#fff,stroke-width:2px,color:#000"
-            )
-        else:
-            lines.append(
-                f"    style {node_id} fill:#16213e,stroke:#a0a0a0,stroke-width:1px,color:#eaeaea"
-            )
+# Mermaid node styles for the core loop, cycled through in action order
+CORE_LOOP_NODE_STYLES = tuple(
+    f"fill:{color},stroke:#fff,stroke-width:2px,color:#fff"
+    for color in CORE_LOOP_COLORS
+)
 
-    return "\n".join(lines)
+# Mermaid node styles for systems keyed by min(priority, 5):
+# 1-2 critical, 3-4 important, 5+ nice-to-have
+_CRITICAL_SYSTEM_STYLE = "fill:#e94560,stroke:#fff,stroke-width:3px,color:#fff"
+_IMPORTANT_SYSTEM_STYLE = "fill:#00d9ff,stroke:#fff,stroke-width:2px,color:#000"
+_OPTIONAL_SYSTEM_STYLE = "fill:#16213e,stroke:#a0a0a0,stroke-width:1px,color:#eaeaea"
+SYSTEM_PRIORITY_STYLES = {
+    1: _CRITICAL_SYSTEM_STYLE,
+    2: _CRITICAL_SYSTEM_STYLE,
+    3: _IMPORTANT_SYSTEM_STYLE,
+    4: _IMPORTANT_SYSTEM_STYLE,
+    5: _OPTIONAL_SYSTEM_STYLE,
+}
+
+# Systems table badge (CSS class, label) keyed by min(priority, 5)
+SYSTEM_PRIORITY_BADGES = {
+    1: ("priority-1", "Critical"),
+    2: ("priority-2", "High"),
+    3: ("priority-3", "Medium"),
+    4: ("priority-4", "Normal"),
+    5: ("priority-5", "Low"),
+}
+
+# Character role keyword to card emoji
+CHARACTER_ROLE_EMOJIS = {
+    "protagonist": "🦸",
+    "antagonist": "👿",
+    "mentor": "🧙",
+    "companion": "🤝",
+    "enemy": "👹",
+    "npc": "👤",
+    "boss": "💀",
+}
+
+# Map special feature frequency to its text color
+FEATURE_FREQUENCY_COLORS = {
+    "common": "var(--text-secondary)",
+    "uncommon": "var(--neon-blue)",
+    "rare": "var(--neon-purple)",
+    "unique": "var(--neon-orange)",
+}
+
+# Risk table severity badge markup
+RISK_SEVERITY_BADGES = {
+    Severity.CRITICAL: '<span class="risk-badge risk-critical">🔴 CRITICAL</span>',
+    Severity.MAJOR: '<span class="risk-badge risk-major">🟠 MAJOR</span>',
+}
+
+# Color and label for boolean flags, indexed by the bool itself
+FLAG_COLORS = ("var(--text-secondary)", "var(--neon-green)")
+FLAG_LABELS = ("No", "Yes")
+
+# Characters that break Mermaid syntax, mapped to safe replacements
+MERMAID_ESCAPE_TABLE = str.maketrans(
+    {
+        '"': "'",
+        "[": "(",
+        "]": ")",
+        "{": "(",
+        "}": ")",
+        "<": "‹",
+        ">": "›",
+        "#": None,
+        "&": "and",
+    }
+)
 
+# Joins core loop steps in the gameplay flow strip (a flex row, so no
+# whitespace is needed between the items)
+LOOP_STEP_SEPARATOR = '<span class="loop-arrow">→</span>'
 
-def _generate_css() -> str:
-    """Generate the embedded CSS styles with enhanced visual elements."""
-    return """
+# Embedded CSS styles with enhanced visual elements (minified once at import)
+DOCUMENT_CSS = _minify_css("""
         :root {
             --bg-primary: #0f0f1a;
             --bg-secondary: #1a1a2e;
@@ -158,6 +132,8 @@ def _generate_css() -> str:
             --neon-orange: #ef8354;
             --warning: #e63946;
             --neon-purple: #a855f7;
+            /* Hero background pattern, inlined so the document stays self-contained */
+            --hero-pattern: url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%23ffffff' fill-opacity='0.03'%3E%3Cpath d='M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E");
         }
         
         * {
@@ -189,7 +165,7 @@ def _generate_css() -> str:
             left: 0;
             right: 0;
             bottom: 0;
-            background: url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%23ffffff' fill-opacity='0.03'%3E%3Cpath d='M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E");
+            background: var(--hero-pattern);
         }
         
         .hero-content {
@@ -1160,8 +1136,289 @@ def _generate_css() -> str:
                 max-width: 100%;
             }
         }
+""")
+
+# Sticky navigation bar with icons (static, identical for every document)
+NAVIGATION_HTML = """
+    <!-- Navigation -->
+    <nav class="nav">
+        <div class="nav-content">
+            <a href="#meta">📋 Overview</a>
+            <a href="#core-loop">🔄 Core Loop</a>
+            <a href="#systems">⚙️ Systems</a>
+            <a href="#progression">📈 Progression</a>
+            <a href="#narrative">📖 Story</a>
+            <a href="#characters">👤 Characters</a>
+            <a href="#tech">💻 Technical</a>
+            <a href="#risks">⚠️ Risks</a>
+        </div>
+    </nav>
 """
 
+# Document head up to the title; the escaped title is written in between
+DOCUMENT_HEAD_START = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>"""
+
+# Tab switching CSS
+TAB_CSS = _minify_css("""
+        /* Tab Navigation */
+        .tab-container {
+            display: flex;
+            gap: 4px;
+            background: rgba(0,0,0,0.3);
+            border-radius: 12px;
+            overflow: hidden;
+            margin: 20px auto;
+            max-width: 500px;
+            padding: 4px;
+        }
+        .tab-btn {
+            flex: 1;
+            padding: 14px 24px;
+            background: transparent;
+            border: none;
+            border-radius: 8px;
+            color: var(--text-secondary);
+            font-size: 1rem;
+            font-weight: 600;
+            cursor: pointer;
+            transition: all 0.3s;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            gap: 8px;
+        }
+        .tab-btn:hover:not(.active) {
+            background: rgba(255,255,255,0.1);
+            color: var(--text-primary);
+        }
+        .tab-btn.active {
+            background: var(--accent);
+            color: #000;
+            box-shadow: 0 2px 8px rgba(233, 69, 96, 0.4);
+        }
+        .tab-btn .tab-icon {
+            font-size: 1.2rem;
+        }
+        .tab-content {
+            display: none;
+        }
+        .tab-content.active {
+            display: block;
+        }
+        /* Content area adjustments */
+        .content-wrapper {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+    """)
+
+# Mermaid.js loader and dark-theme initializer
+MERMAID_SCRIPT_HTML = """    <!-- Mermaid.js for diagrams -->
+    <script src="https://cdn.jsdelivr.net/npm/mermaid@11/dist/mermaid.min.js"></script>
+    <script>
+        document.addEventListener('DOMContentLoaded', function() {
+            mermaid.initialize({
+                startOnLoad: true,
+                theme: 'dark',
+                themeVariables: {
+                    primaryColor: '#16213e',
+                    primaryTextColor: '#eaeaea',
+                    primaryBorderColor: '#e94560',
+                    lineColor: '#00d9ff',
+                    secondaryColor: '#1a1a2e',
+                    tertiaryColor: '#0f3460',
+                    background: '#0f0f1a',
+                    mainBkg: '#16213e',
+                    nodeBorder: '#e94560',
+                    clusterBkg: '#1a1a2e',
+                    titleColor: '#00d9ff',
+                    edgeLabelBackground: '#16213e'
+                },
+                flowchart: {
+                    useMaxWidth: true,
+                    htmlLabels: true,
+                    curve: 'basis',
+                    nodeSpacing: 50,
+                    rankSpacing: 50
+                }
+            });
+        });
+    </script>
+"""
+
+# Rest of the head after the title: the stylesheet
+DOCUMENT_HEAD_END = (
+    """ - Game Design Document</title>
+    <style>
+        """
+    + DOCUMENT_CSS
+    + """
+        """
+    + TAB_CSS
+    + """
+    </style>
+"""
+)
+
+# Close of the head; MERMAID_SCRIPT_HTML is written just before it when needed
+DOCUMENT_BODY_START = """</head>
+<body>
+    """
+
+# Tab switching JavaScript
+TAB_SCRIPT_HTML = """
+    <script>
+        // Check localStorage availability
+        function isLocalStorageAvailable() {
+            try {
+                const test = '__storage_test__';
+                localStorage.setItem(test, test);
+                localStorage.removeItem(test);
+                return true;
+            } catch (e) {
+                return false;
+            }
+        }
+        
+        function switchTab(tabName) {
+            // Hide all tab contents
+            document.querySelectorAll('.tab-content').forEach(content => {
+                content.classList.remove('active');
+            });
+            // Deactivate all tab buttons
+            document.querySelectorAll('.tab-btn').forEach(btn => {
+                btn.classList.remove('active');
+            });
+            // Show selected tab content
+            document.getElementById('tab-' + tabName).classList.add('active');
+            // Activate selected tab button
+            document.querySelector('[data-tab="' + tabName + '"]').classList.add('active');
+            // Save preference
+            if (isLocalStorageAvailable()) {
+                localStorage.setItem('pivot-protocol-active-tab', tabName);
+            }
+        }
+        // Load saved tab preference
+        document.addEventListener('DOMContentLoaded', function() {
+            const savedTab = isLocalStorageAvailable() ? (localStorage.getItem('pivot-protocol-active-tab') || 'planning') : 'planning';
+            switchTab(savedTab);
+        });
+    </script>
+    """
+
+
+# Escape HTML special characters. Every call site passes a str, so html.escape
+# is bound directly instead of going through a wrapper that re-coerces with str().
+# Names recur across tables, cards and diagrams, so results are memoized.
+_escape = lru_cache(maxsize=4096)(html.escape)
+
+
+@lru_cache(maxsize=256)
+def _pretty(member: Enum) -> str:
+    """
+    Convert an enum member to a display label (e.g. "pixel_art" -> "Pixel Art").
+
+    Enum values are lowercase identifiers, so the labels are HTML-safe and are
+    interpolated without going through _escape.
+    """
+    return member.value.replace("_", " ").title()
+
+
+def _escape_mermaid(text: str) -> str:
+    """Escape text for use in Mermaid diagrams."""
+    # Remove or escape characters that break Mermaid syntax in a single pass
+    return str(text).translate(MERMAID_ESCAPE_TABLE)
+
+
+def _escape_mermaid_many(texts: list[str]) -> list[str]:
+    """Escape several Mermaid labels with one translate pass over a joined buffer."""
+    escaped = "\x00".join(texts).translate(MERMAID_ESCAPE_TABLE).split("\x00")
+    if len(escaped) != len(texts):
+        # A label contained the separator itself; escape one by one instead
+        return [_escape_mermaid(text) for text in texts]
+    return escaped
+
+
+def _iter_core_loop_mermaid(gdd: "GameDesignDocument") -> Iterator[str]:
+    """Yield the lines of a Mermaid flowchart for the core gameplay loop."""
+    if not hasattr(gdd, "core_loop") or not gdd.core_loop:
+        return
+    actions = gdd.core_loop.primary_actions
+
+    if len(actions) < 2:
+        return
+
+    # Build the flowchart
+    yield "flowchart LR"
+
+    # Create nodes with styled boxes
+    for i, action_text in enumerate(_escape_mermaid_many(actions)):
+        yield f'    A{i}["{action_text}"]'
+
+    # Connect nodes in sequence
+    for i in range(len(actions) - 1):
+        yield f"    A{i} --> A{i + 1}"
+
+    # Close the loop (connect last to first)
+    yield f"    A{len(actions) - 1} --> A0"
+
+    # Add styling
+    yield ""
+    yield "    %% Styling"
+    for i, style in zip(range(len(actions)), cycle(CORE_LOOP_NODE_STYLES)):
+        yield f"    style A{i} {style}"
+
+
+def _iter_systems_mermaid(gdd: "GameDesignDocument") -> Iterator[str]:
+    """Yield the lines of a Mermaid diagram showing game system relationships."""
+    if not hasattr(gdd, "systems") or not gdd.systems:
+        return
+    systems = gdd.systems
+
+    if len(systems) < 2:
+        return
+
+    # Node IDs are computed once and shared by the node, edge and style passes
+    node_ids = [f"S{i}" for i in range(len(systems))]
+
+    # Create a map of lowercased system names to IDs
+    system_ids = {}
+    for node_id, system in zip(node_ids, systems):
+        system_ids[system.name.lower()] = node_id
+
+    # Add system nodes with their types
+    yield "flowchart TB"
+    names = _escape_mermaid_many([system.name for system in systems])
+    for node_id, name, system in zip(node_ids, names, systems):
+        yield f'    {node_id}["{name}<br/><small>{_pretty(system.type)}</small>"]'
+
+    # Add dependencies as edges (case-insensitive exact match on system name)
+    for node_id, system in zip(node_ids, systems):
+        for dep in system.dependencies:
+            dep_id = system_ids.get(dep.lower())
+            if dep_id is not None:
+                yield f"    {dep_id} --> {node_id}"
+
+    # Style based on priority
+    yield ""
+    yield "    %% Priority-based styling"
+    for node_id, system in zip(node_ids, systems):
+        yield f"    style {node_id} {SYSTEM_PRIORITY_STYLES[min(system.priority, 5)]}"
+
+
+def _has_mermaid_diagrams(gdd: GameDesignDocument) -> bool:
+    """Check whether any section will emit a Mermaid diagram."""
+    # Only the first line of each diagram is generated
+    return (
+        next(_iter_core_loop_mermaid(gdd), None) is not None
+        or next(_iter_systems_mermaid(gdd), None) is not None
+    )
+
 
 def _generate_hero_section(gdd: GameDesignDocument) -> str:
     """Generate the hero section with game title and badges."""
@@ -1172,14 +1429,13 @@ def _generate_hero_section(gdd: GameDesignDocument) -> str:
     if gdd.meta.elevator_pitch:
         tagline = f'<p class="tagline">"{_escape(gdd.meta.elevator_pitch)}"</p>'
 
-    # Generate badges
-    badges = []
-    for genre in gdd.meta.genres[:4]:  # Limit to 4 genres
-        badges.append(
-            f'<span class="badge">{_escape(genre.value.replace("_", " ").title())}</span>'
-        )
-
-    badges_html = "\n                ".join(badges)
+    # Generate badges (limit to 4 genres)
+    badges_html = "".join(
+        [
+            f'<span class="badge">{_pretty(genre)}</span>'
+            for genre in gdd.meta.genres[:4]
+        ]
+    )
 
     return f"""
     <!-- Hero Section -->
@@ -1196,31 +1452,10 @@ def _generate_hero_section(gdd: GameDesignDocument) -> str:
 """
 
 
-def _generate_navigation() -> str:
-    """Generate the sticky navigation bar with icons."""
-    return """
-    <!-- Navigation -->
-    <nav class="nav">
-        <div class="nav-content">
-            <a href="#meta">📋 Overview</a>
-            <a href="#core-loop">🔄 Core Loop</a>
-            <a href="#systems">⚙️ Systems</a>
-            <a href="#progression">📈 Progression</a>
-            <a href="#narrative">📖 Story</a>
-            <a href="#characters">👤 Characters</a>
-            <a href="#tech">💻 Technical</a>
-            <a href="#risks">⚠️ Risks</a>
-        </div>
-    </nav>
-"""
-
-
 def _generate_meta_section(gdd: GameDesignDocument) -> str:
     """Generate the game overview/meta section with enhanced visuals."""
-    genres = ", ".join(g.value.replace("_", " ").title() for g in gdd.meta.genres)
-    platforms = ", ".join(
-        p.value.replace("_", " ").title() for p in gdd.meta.target_platforms
-    )
+    genres = ", ".join(map(_pretty, gdd.meta.genres))
+    platforms = ", ".join(map(_pretty, gdd.meta.target_platforms))
 
     # Calculate months from weeks
     months = gdd.meta.estimated_dev_time_weeks / 4.0
@@ -1233,19 +1468,19 @@ def _generate_meta_section(gdd: GameDesignDocument) -> str:
             <div class="card-grid">
                 <div class="card">
                     <h4>🎮 Genres</h4>
-                    <p><strong>{_escape(genres)}</strong></p>
+                    <p><strong>{genres}</strong></p>
                 </div>
                 
                 <div class="card">
                     <h4>🖥️ Platforms</h4>
-                    <p><strong>{_escape(platforms)}</strong></p>
+                    <p><strong>{platforms}</strong></p>
                 </div>
                 
                 <div class="card">
                     <h4>👥 Target Audience</h4>
                     <p><strong>{_escape(gdd.meta.target_audience)}</strong></p>
                     <p style="color: var(--text-secondary); margin-top: 8px">
-                        Rating: <span style="color: var(--neon-orange)">{_escape(gdd.meta.audience_rating.value.replace("_", " ").title())}</span>
+                        Rating: <span style="color: var(--neon-orange)">{_pretty(gdd.meta.audience_rating)}</span>
                     </p>
                 </div>
                 
@@ -1265,21 +1500,22 @@ def _generate_meta_section(gdd: GameDesignDocument) -> str:
 """
 
 
-def _generate_core_loop_section(gdd: GameDesignDocument) -> str:
+def _generate_core_loop_section(
+    gdd: GameDesignDocument, include_mermaid: bool = True
+) -> str:
     """Generate the core loop section with Mermaid diagram."""
     loop = gdd.core_loop
 
-    # Generate loop steps for visual display
-    steps_html = []
-    for i, action in enumerate(loop.primary_actions):
-        steps_html.append(f'<span class="loop-step">{_escape(action)}</span>')
-        if i < len(loop.primary_actions) - 1:
-            steps_html.append('<span class="loop-arrow">→</span>')
-
-    steps = "\n                    ".join(steps_html)
+    # Generate loop steps for visual display, with an arrow between each step
+    steps = LOOP_STEP_SEPARATOR.join(
+        [
+            f'<span class="loop-step">{_escape(action)}</span>'
+            for action in loop.primary_actions
+        ]
+    )
 
-    # Generate Mermaid diagram
-    mermaid_diagram = _generate_core_loop_mermaid(gdd)
+    # Generate Mermaid diagram (skipped entirely when it won't be rendered)
+    mermaid_diagram = "\n".join(_iter_core_loop_mermaid(gdd)) if include_mermaid else ""
     mermaid_html = ""
     if mermaid_diagram:
         mermaid_html = f"""
@@ -1295,7 +1531,7 @@ def _generate_core_loop_section(gdd: GameDesignDocument) -> str:
     hooks_html = ""
     if loop.hook_elements:
         hooks_items = "".join(
-            f"<li>{_escape(hook)}</li>" for hook in loop.hook_elements
+            [f"<li>{_escape(hook)}</li>" for hook in loop.hook_elements]
         )
         hooks_html = f"""
             <details>
@@ -1317,11 +1553,12 @@ def _generate_core_loop_section(gdd: GameDesignDocument) -> str:
                     <p><strong>Response:</strong> {_escape(fb.response)}</p>
                     <p style="color: var(--text-secondary); font-size: 0.9rem">{_escape(fb.purpose)}</p>
                 </div>""")
+        feedback_items_html = "".join(feedback_items)
         feedback_html = f"""
             <details>
                 <summary>📢 Feedback Mechanisms ({len(loop.feedback_mechanisms)} items)</summary>
                 <div class="content">
-                    {"".join(feedback_items)}
+                    {feedback_items_html}
                 </div>
             </details>
 """
@@ -1371,11 +1608,13 @@ def _generate_core_loop_section(gdd: GameDesignDocument) -> str:
 """
 
 
-def _generate_systems_section(gdd: GameDesignDocument) -> str:
+def _generate_systems_section(
+    gdd: GameDesignDocument, include_mermaid: bool = True
+) -> str:
     """Generate the game systems section with tables and relationship diagram."""
 
     # Generate Mermaid diagram for system relationships
-    mermaid_diagram = _generate_systems_mermaid(gdd)
+    mermaid_diagram = "\n".join(_iter_systems_mermaid(gdd)) if include_mermaid else ""
     mermaid_html = ""
     if mermaid_diagram:
         mermaid_html = f"""
@@ -1401,41 +1640,37 @@ def _generate_systems_section(gdd: GameDesignDocument) -> str:
             </div>
 """
 
-    # Generate systems table rows with priority badges
+    # Generate systems table rows and detailed cards in one pass, so each
+    # system's shared fields are escaped and looked up once
     rows = []
+    cards = []
     for system in gdd.systems:
+        name = _escape(system.name)
+        type_label = _pretty(system.type)
+        priority_class, priority_text = SYSTEM_PRIORITY_BADGES[min(system.priority, 5)]
         mechanics = ", ".join(system.mechanics[:5])  # Limit mechanics shown
-        priority_class = f"priority-{min(system.priority, 5)}"
-        priority_text = ["Critical", "High", "Medium", "Normal", "Low"][
-            min(system.priority, 5) - 1
-        ]
         rows.append(f"""
                     <tr>
-                        <td><strong>{_escape(system.name)}</strong></td>
-                        <td><span class="system-tag">{_escape(system.type.value.replace("_", " ").title())}</span></td>
+                        <td><strong>{name}</strong></td>
+                        <td><span class="system-tag">{type_label}</span></td>
                         <td>{_escape(mechanics)}</td>
                         <td><span class="priority-badge {priority_class}">{priority_text}</span></td>
                     </tr>""")
 
-    rows_html = "".join(rows)
-
-    # Generate detailed system cards (collapsible for each)
-    cards = []
-    for system in gdd.systems:
-        mechanics_list = "".join(f"<li>{_escape(m)}</li>" for m in system.mechanics)
+        # Detailed system card (mechanics collapsible)
+        mechanics_list = "".join([f"<li>{_escape(m)}</li>" for m in system.mechanics])
         deps_html = ""
         if system.dependencies:
             deps = ", ".join(system.dependencies)
             deps_html = f'<p style="color: var(--text-secondary); font-size: 0.9rem; margin-top: 10px">Dependencies: {_escape(deps)}</p>'
 
-        priority_class = f"priority-{min(system.priority, 5)}"
         cards.append(f"""
                 <div class="card">
                     <div style="display: flex; justify-content: space-between; align-items: start; margin-bottom: 10px">
-                        <h4 style="margin: 0">{_escape(system.name)}</h4>
+                        <h4 style="margin: 0">{name}</h4>
                         <span class="priority-badge {priority_class}">P{system.priority}</span>
                     </div>
-                    <span class="system-tag">{_escape(system.type.value.replace("_", " ").title())}</span>
+                    <span class="system-tag">{type_label}</span>
                     <p style="margin: 15px 0">{_escape(system.description)}</p>
                     <details>
                         <summary>Mechanics ({len(system.mechanics)} items)</summary>
@@ -1446,7 +1681,8 @@ def _generate_systems_section(gdd: GameDesignDocument) -> str:
                     {deps_html}
                 </div>""")
 
-    cards_html = "\n            ".join(cards)
+    rows_html = "".join(rows)
+    cards_html = "".join(cards)
 
     return f"""
         <!-- Systems Section -->
@@ -1484,7 +1720,7 @@ def _generate_progression_section(gdd: GameDesignDocument) -> str:
 
     # Generate milestone timeline
     timeline_items = []
-    for i, milestone in enumerate(prog.milestones):
+    for milestone in prog.milestones:
         rewards_html = ""
         if milestone.rewards:
             rewards = ", ".join(milestone.rewards[:3])
@@ -1503,7 +1739,7 @@ def _generate_progression_section(gdd: GameDesignDocument) -> str:
                     {rewards_html}
                 </div>""")
 
-    timeline_html = "\n            ".join(timeline_items)
+    timeline_html = "".join(timeline_items)
 
     # Generate difficulty levels if present (collapsible)
     difficulty_html = ""
@@ -1513,7 +1749,7 @@ def _generate_progression_section(gdd: GameDesignDocument) -> str:
             modifiers_html = ""
             if diff.modifiers:
                 mods = ", ".join(
-                    f"{k}: {v}" for k, v in list(diff.modifiers.items())[:3]
+                    [f"{k}: {v}" for k, v in islice(diff.modifiers.items(), 3)]
                 )
                 modifiers_html = f'<p style="color: var(--text-secondary); font-size: 0.85rem; margin-top: 8px">{_escape(mods)}</p>'
             diff_cards.append(f"""
@@ -1522,12 +1758,13 @@ def _generate_progression_section(gdd: GameDesignDocument) -> str:
                         <p>{_escape(diff.description)}</p>
                         {modifiers_html}
                     </div>""")
+        diff_cards_html = "".join(diff_cards)
         difficulty_html = f"""
             <details>
                 <summary>🎮 Difficulty Levels ({len(prog.difficulty_levels)} modes)</summary>
                 <div class="content">
                     <div class="card-grid">
-                        {"".join(diff_cards)}
+                        {diff_cards_html}
                     </div>
                 </div>
             </details>
@@ -1561,7 +1798,7 @@ def _generate_progression_section(gdd: GameDesignDocument) -> str:
             <div class="card-grid">
                 <div class="card">
                     <h4>📊 Progression Type</h4>
-                    <p style="font-size: 1.5rem; font-weight: bold; color: var(--neon-blue)">{_escape(prog.type.value.replace("_", " ").title())}</p>
+                    <p style="font-size: 1.5rem; font-weight: bold; color: var(--neon-blue)">{_pretty(prog.type)}</p>
                 </div>
                 <div class="card">
                     <h4>📉 Difficulty Curve</h4>
@@ -1584,9 +1821,7 @@ def _generate_narrative_section(gdd: GameDesignDocument) -> str:
     """Generate the narrative/story section with enhanced visuals."""
     narrative = gdd.narrative
     themes = ", ".join(narrative.themes)
-    delivery = ", ".join(
-        d.value.replace("_", " ").title() for d in narrative.narrative_delivery
-    )
+    delivery = ", ".join(map(_pretty, narrative.narrative_delivery))
 
     # Story beats timeline (collapsible)
     beats_html = ""
@@ -1597,12 +1832,13 @@ def _generate_narrative_section(gdd: GameDesignDocument) -> str:
                 <div class="timeline-item">
                     <p><strong>Beat {i + 1}:</strong> {_escape(beat)}</p>
                 </div>""")
+        beats_items_html = "".join(beats_items)
         beats_html = f"""
             <details>
                 <summary>📜 Story Beats ({len(narrative.key_story_beats)} beats)</summary>
                 <div class="content">
                     <div class="timeline">
-                        {"".join(beats_items)}
+                        {beats_items_html}
                     </div>
                 </div>
             </details>
@@ -1644,7 +1880,7 @@ def _generate_narrative_section(gdd: GameDesignDocument) -> str:
                 </div>
                 <div class="card">
                     <h4>📣 Narrative Delivery</h4>
-                    <p><strong>{_escape(delivery)}</strong></p>
+                    <p><strong>{delivery}</strong></p>
                 </div>
                 <div class="card">
                     <h4>🏗️ Story Structure</h4>
@@ -1662,32 +1898,24 @@ def _generate_characters_section(gdd: GameDesignDocument) -> str:
     if not gdd.narrative.characters:
         return ""
 
-    # Role to emoji mapping
-    role_emojis = {
-        "protagonist": "🦸",
-        "antagonist": "👿",
-        "mentor": "🧙",
-        "companion": "🤝",
-        "enemy": "👹",
-        "npc": "👤",
-        "boss": "💀",
-    }
-
     cards = []
     for char in gdd.narrative.characters:
-        # Get emoji based on role
+        # Get emoji based on role; compound roles ("main protagonist") fall
+        # back to a substring scan
         role_lower = char.role.lower()
-        emoji = "👤"
-        for key, value in role_emojis.items():
-            if key in role_lower:
-                emoji = value
-                break
+        emoji = CHARACTER_ROLE_EMOJIS.get(role_lower)
+        if emoji is None:
+            emoji = next(
+                (v for k, v in CHARACTER_ROLE_EMOJIS.items() if k in role_lower), "👤"
+            )
 
         abilities_html = ""
         if char.abilities:
             ability_tags = " ".join(
-                f'<span class="system-tag">{_escape(a)}</span>'
-                for a in char.abilities[:5]
+                [
+                    f'<span class="system-tag">{_escape(a)}</span>'
+                    for a in char.abilities[:5]
+                ]
             )
             abilities_html = f'<div style="margin-top: 10px">{ability_tags}</div>'
 
@@ -1710,7 +1938,7 @@ def _generate_characters_section(gdd: GameDesignDocument) -> str:
                 </div>
             </div>""")
 
-    cards_html = "\n            ".join(cards)
+    cards_html = "".join(cards)
 
     return f"""
         <!-- Characters Section -->
@@ -1727,7 +1955,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
 
     # Technology tags
     tech_tags = " ".join(
-        f'<span class="system-tag">{_escape(t)}</span>' for t in tech.key_technologies
+        [f'<span class="system-tag">{_escape(t)}</span>' for t in tech.key_technologies]
     )
 
     # Performance targets table
@@ -1736,7 +1964,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
         for target in tech.performance_targets:
             perf_rows += f"""
                     <tr>
-                        <td>🖥️ {_escape(target.platform.value.replace("_", " ").title())}</td>
+                        <td>🖥️ {_pretty(target.platform)}</td>
                         <td style="color: var(--neon-green)">{target.target_fps} FPS</td>
                         <td>{_escape(target.min_resolution)}</td>
                         <td>{target.max_ram_mb} MB</td>
@@ -1769,7 +1997,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
     accessibility_html = ""
     if tech.accessibility_features:
         features = "".join(
-            f"<li>✅ {_escape(f)}</li>" for f in tech.accessibility_features
+            [f"<li>✅ {_escape(f)}</li>" for f in tech.accessibility_features]
         )
         accessibility_html = f"""
             <details>
@@ -1798,9 +2026,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
     sound_cats = ", ".join(audio.sound_categories)
 
     # Networking badge
-    network_color = (
-        "var(--neon-green)" if tech.networking_required else "var(--text-secondary)"
-    )
+    network_color = FLAG_COLORS[tech.networking_required]
     network_text = "🌐 Online" if tech.networking_required else "💾 Offline"
 
     return f"""
@@ -1811,12 +2037,12 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
             <div class="card-grid">
                 <div class="card">
                     <h4>🎮 Engine</h4>
-                    <p style="font-size: 1.8rem; font-weight: bold; color: var(--neon-blue)">{_escape(tech.recommended_engine.value.title())}</p>
+                    <p style="font-size: 1.8rem; font-weight: bold; color: var(--neon-blue)">{_pretty(tech.recommended_engine)}</p>
                 </div>
                 
                 <div class="card">
                     <h4>🎨 Art Style</h4>
-                    <p style="font-size: 1.5rem; font-weight: bold">{_escape(tech.art_style.value.replace("_", " ").title())}</p>
+                    <p style="font-size: 1.5rem; font-weight: bold">{_pretty(tech.art_style)}</p>
                 </div>
                 
                 <div class="card">
@@ -1838,7 +2064,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
                     <h4>🎼 Music Style</h4>
                     <p>{_escape(audio.music_style)}</p>
                     <p style="color: var(--text-secondary); margin-top: 8px">
-                        Adaptive: <span style="color: {"var(--neon-green)" if audio.adaptive_music else "var(--text-secondary)"}">{"Yes" if audio.adaptive_music else "No"}</span>
+                        Adaptive: <span style="color: {FLAG_COLORS[audio.adaptive_music]}">{FLAG_LABELS[audio.adaptive_music]}</span>
                     </p>
                 </div>
                 <div class="card">
@@ -1847,7 +2073,7 @@ def _generate_technical_section(gdd: GameDesignDocument) -> str:
                 </div>
                 <div class="card">
                     <h4>🎙️ Voice Acting</h4>
-                    <p style="font-size: 1.5rem; font-weight: bold; color: {"var(--neon-green)" if audio.voice_acting else "var(--text-secondary)"}">{"Yes" if audio.voice_acting else "No"}</p>
+                    <p style="font-size: 1.5rem; font-weight: bold; color: {FLAG_COLORS[audio.voice_acting]}">{FLAG_LABELS[audio.voice_acting]}</p>
                 </div>
             </div>
             {accessibility_html}
@@ -1870,25 +2096,22 @@ def _generate_risks_section(gdd: GameDesignDocument) -> str:
         </section>
 """
 
-    # Count by severity
-    critical_count = sum(1 for r in gdd.risks if r.severity.value == "critical")
-    major_count = len(gdd.risks) - critical_count
-
+    # Build rows and count by severity in the same pass
+    critical_count = 0
     rows = []
     for risk in gdd.risks:
-        severity_class = (
-            "risk-critical" if risk.severity.value == "critical" else "risk-major"
-        )
-        severity_icon = "🔴" if risk.severity.value == "critical" else "🟠"
+        if risk.severity is Severity.CRITICAL:
+            critical_count += 1
         rows.append(f"""
                     <tr>
-                        <td><span class="risk-badge {severity_class}">{severity_icon} {_escape(risk.severity.value.upper())}</span></td>
+                        <td>{RISK_SEVERITY_BADGES[risk.severity]}</td>
                         <td><strong>{_escape(risk.category)}</strong></td>
                         <td>{_escape(risk.description)}</td>
                         <td style="color: var(--neon-green)">{_escape(risk.mitigation)}</td>
                     </tr>""")
 
     rows_html = "".join(rows)
+    major_count = len(gdd.risks) - critical_count
 
     # Summary cards
     summary_html = f"""
@@ -1941,8 +2164,7 @@ def _generate_map_hints_section(gdd: GameDesignDocument) -> str:
 
     # Biome tags
     biome_tags = " ".join(
-        f'<span class="system-tag">{_escape(b.value.replace("_", " ").title())}</span>'
-        for b in hints.biomes
+        [f'<span class="system-tag">{_pretty(b)}</span>' for b in hints.biomes]
     )
 
     # Special features (collapsible)
@@ -1950,13 +2172,7 @@ def _generate_map_hints_section(gdd: GameDesignDocument) -> str:
     if hints.special_features:
         feature_cards = []
         for feature in hints.special_features:
-            freq_color = {
-                "common": "var(--text-secondary)",
-                "uncommon": "var(--neon-blue)",
-                "rare": "var(--neon-purple)",
-                "unique": "var(--neon-orange)",
-            }
-            freq_col = freq_color.get(
+            freq_col = FEATURE_FREQUENCY_COLORS.get(
                 feature.frequency.lower(), "var(--text-secondary)"
             )
             reqs = ", ".join(feature.requirements) if feature.requirements else "None"
@@ -1967,12 +2183,13 @@ def _generate_map_hints_section(gdd: GameDesignDocument) -> str:
                         <p style="margin: 10px 0">{_escape(feature.description)}</p>
                         <p style="color: var(--text-secondary); font-size: 0.9rem">Requirements: {_escape(reqs)}</p>
                     </div>""")
+        feature_cards_html = "".join(feature_cards)
         features_html = f"""
             <details>
                 <summary>✨ Special Features ({len(hints.special_features)} features)</summary>
                 <div class="content">
                     <div class="card-grid">
-                        {"".join(feature_cards)}
+                        {feature_cards_html}
                     </div>
                 </div>
             </details>
@@ -1988,11 +2205,12 @@ def _generate_map_hints_section(gdd: GameDesignDocument) -> str:
                     <strong>{_escape(obs.type.title())}</strong> - Density: {_escape(obs.density)}
                     <p style="color: var(--text-secondary); font-size: 0.9rem">{_escape(obs.purpose)}</p>
                 </div>""")
+        obs_items_html = "".join(obs_items)
         obstacles_html = f"""
             <details>
                 <summary>🧱 Obstacles ({len(hints.obstacles)} types)</summary>
                 <div class="content">
-                    {"".join(obs_items)}
+                    {obs_items_html}
                 </div>
             </details>
 """
@@ -2042,7 +2260,7 @@ def _generate_footer(gdd: GameDesignDocument) -> str:
             🤖 Generated by <strong>Game Planner</strong> - Dual-Agent Actor-Critic System
         </p>
         <p style="margin-top: 10px; font-size: 0.9rem">
-            📅 {_escape(gdd.generated_at[:10] if len(gdd.generated_at) > 10 else gdd.generated_at)}
+            📅 {_escape(gdd.generated_at[:10])}
         </p>
         <p style="margin-top: 20px; font-size: 0.8rem; color: var(--text-secondary)">
             Made with 💜 using AI-powered game design technology
@@ -2051,194 +2269,28 @@ def _generate_footer(gdd: GameDesignDocument) -> str:
 """
 
 
-def gdd_to_html(gdd: GameDesignDocument) -> str:
+def _write_document(
+    gdd: GameDesignDocument,
+    write: Callable[[str], None],
+    include_mermaid: bool = True,
+) -> None:
     """
-    Convert a GameDesignDocument to a beautifully styled HTML document.
-
-    The generated HTML includes:
-    - Hero section with game title and badges
-    - Sticky navigation bar
-    - Meta info cards (genres, platforms, audience, dev time)
-    - Core loop diagram with actions
-    - Systems tables and cards
-    - Progression timeline with milestones
-    - Narrative section with story and themes
-    - Character cards
-    - Technical specifications with performance targets
-    - Risk assessment table
-    - Map generation hints (if present)
-
-    The styling uses a dark theme with neon accents for a modern game design aesthetic.
-    All CSS is embedded for single-file distribution.
-
-    Args:
-        gdd: The GameDesignDocument to convert
+    Emit the complete HTML document for a GDD fragment by fragment.
 
-    Returns:
-        Complete HTML document as a string
+    Fragments are passed to ``write`` in document order, so the document is
+    assembled in a single pass by the caller (e.g. ``list.append`` followed by
+    one ``"".join``).
     """
-    title = _escape(gdd.meta.title)
-    css = _generate_css()
-
-    # Generate all sections
-    hero = _generate_hero_section(gdd)
-    nav = _generate_navigation()
-    meta = _generate_meta_section(gdd)
-    core_loop = _generate_core_loop_section(gdd)
-    systems = _generate_systems_section(gdd)
-    progression = _generate_progression_section(gdd)
-    narrative = _generate_narrative_section(gdd)
-    characters = _generate_characters_section(gdd)
-    technical = _generate_technical_section(gdd)
-    risks = _generate_risks_section(gdd)
-    map_hints = _generate_map_hints_section(gdd)
-    footer = _generate_footer(gdd)
-
-    # Generate task details and sidebar (from task_details module)
-    task_details = generate_task_details_html()
-    sidebar = generate_sidebar_checklist_with_links()
-    smooth_scroll_js = generate_smooth_scroll_js()
-
-    # Tab switching CSS
-    tab_css = """
-        /* Tab Navigation */
-        .tab-container {
-            display: flex;
-            gap: 4px;
-            background: rgba(0,0,0,0.3);
-            border-radius: 12px;
-            overflow: hidden;
-            margin: 20px auto;
-            max-width: 500px;
-            padding: 4px;
-        }
-        .tab-btn {
-            flex: 1;
-            padding: 14px 24px;
-            background: transparent;
-            border: none;
-            border-radius: 8px;
-            color: var(--text-secondary);
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            transition: all 0.3s;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            gap: 8px;
-        }
-        .tab-btn:hover:not(.active) {
-            background: rgba(255,255,255,0.1);
-            color: var(--text-primary);
-        }
-        .tab-btn.active {
-            background: var(--accent);
-            color: #000;
-            box-shadow: 0 2px 8px rgba(233, 69, 96, 0.4);
-        }
-        .tab-btn .tab-icon {
-            font-size: 1.2rem;
-        }
-        .tab-content {
-            display: none;
-        }
-        .tab-content.active {
-            display: block;
-        }
-        /* Content area adjustments */
-        .content-wrapper {
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-    """
-
-    # Tab switching JavaScript
-    tab_js = """
-    <script>
-        // Check localStorage availability
-        function isLocalStorageAvailable() {
-            try {
-                const test = '__storage_test__';
-                localStorage.setItem(test, test);
-                localStorage.removeItem(test);
-                return true;
-            } catch (e) {
-                return false;
-            }
-        }
-        
-        function switchTab(tabName) {
-            // Hide all tab contents
-            document.querySelectorAll('.tab-content').forEach(content => {
-                content.classList.remove('active');
-            });
-            // Deactivate all tab buttons
-            document.querySelectorAll('.tab-btn').forEach(btn => {
-                btn.classList.remove('active');
-            });
-            // Show selected tab content
-            document.getElementById('tab-' + tabName).classList.add('active');
-            // Activate selected tab button
-            document.querySelector('[data-tab="' + tabName + '"]').classList.add('active');
-            // Save preference
-            if (isLocalStorageAvailable()) {
-                localStorage.setItem('pivot-protocol-active-tab', tabName);
-            }
-        }
-        // Load saved tab preference
-        document.addEventListener('DOMContentLoaded', function() {
-            const savedTab = isLocalStorageAvailable() ? (localStorage.getItem('pivot-protocol-active-tab') || 'planning') : 'planning';
-            switchTab(savedTab);
-        });
-    </script>
-    """
-
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Game Design Document</title>
-    <style>
-        {css}
-        {tab_css}
-    </style>
-    <!-- Mermaid.js for diagrams -->
-    <script src="https://cdn.jsdelivr.net/npm/mermaid@11/dist/mermaid.min.js"></script>
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            mermaid.initialize({{
-                startOnLoad: true,
-                theme: 'dark',
-                themeVariables: {{
-                    primaryColor: '#16213e',
-                    primaryTextColor: '#eaeaea',
-                    primaryBorderColor: '#e94560',
-                    lineColor: '#00d9ff',
-                    secondaryColor: '#1a1a2e',
-                    tertiaryColor: '#0f3460',
-                    background: '#0f0f1a',
-                    mainBkg: '#16213e',
-                    nodeBorder: '#e94560',
-                    clusterBkg: '#1a1a2e',
-                    titleColor: '#00d9ff',
-                    edgeLabelBackground: '#16213e'
-                }},
-                flowchart: {{
-                    useMaxWidth: true,
-                    htmlLabels: true,
-                    curve: 'basis',
-                    nodeSpacing: 50,
-                    rankSpacing: 50
-                }}
-            }});
-        }});
-    </script>
-</head>
-<body>
-    {hero}
-    {nav}
+    write(DOCUMENT_HEAD_START)
+    write(_escape(gdd.meta.title))
+    write(DOCUMENT_HEAD_END)
+    if include_mermaid and _has_mermaid_diagrams(gdd):
+        write(MERMAID_SCRIPT_HTML)
+    write(DOCUMENT_BODY_START)
+    write(_generate_hero_section(gdd))
+    write("\n    ")
+    write(NAVIGATION_HTML)
+    write("""
     
     <!-- Tab Navigation -->
     <div class="tab-container">
@@ -2257,39 +2309,162 @@ def gdd_to_html(gdd: GameDesignDocument) -> str:
             <div class="content-wrapper">
                 <!-- 기획문서 Tab -->
                 <div id="tab-planning" class="tab-content active">
-                    <main class="container">
-                        {meta}
-                        {core_loop}
-                        {systems}
-                        {progression}
-                        {narrative}
-                        {characters}
-                        {technical}
-                        {risks}
-                        {map_hints}
+                    <main class="container">""")
+    planning_sections = (
+        _generate_meta_section(gdd),
+        _generate_core_loop_section(gdd, include_mermaid),
+        _generate_systems_section(gdd, include_mermaid),
+        _generate_progression_section(gdd),
+        _generate_narrative_section(gdd),
+        _generate_characters_section(gdd),
+        _generate_technical_section(gdd),
+        _generate_risks_section(gdd),
+        _generate_map_hints_section(gdd),
+    )
+    for section in planning_sections:
+        write("\n                        ")
+        write(section)
+
+    # Task details and sidebar (from task_details module)
+    write("""
                     </main>
                 </div>
                 
                 <!-- 개발문서 Tab -->
                 <div id="tab-development" class="tab-content">
                     <main class="container">
-                        {task_details}
+                        """)
+    write(generate_task_details_html())
+    write("""
                     </main>
                 </div>
             </div>
         </div>
         
         <!-- Sidebar with clickable checklist -->
-        {sidebar}
+        """)
+    write(generate_sidebar_checklist_with_links())
+    write("""
     </div>
     
-    {footer}
+    """)
+    write(_generate_footer(gdd))
+    write("""
     
     <!-- Tab switching script -->
-    {tab_js}
+    """)
+    write(TAB_SCRIPT_HTML)
+    write("""
     
     <!-- Smooth scroll and sidebar functionality -->
-    {smooth_scroll_js}
+    """)
+    write(generate_smooth_scroll_js())
+    write("""
 </body>
 </html>
-"""
+""")
+
+
+# Recent renders keyed on (model_dump_json(), include_mermaid), oldest first
+_RENDER_CACHE: OrderedDict[tuple[str, bool], str] = OrderedDict()
+_RENDER_CACHE_SIZE = 8
+
+
+def _render(gdd: GameDesignDocument, include_mermaid: bool) -> str:
+    """Render a GDD to a single HTML string."""
+    parts: list[str] = []
+    _write_document(gdd, parts.append, include_mermaid)
+    return "".join(parts)
+
+
+def gdd_to_html(
+    gdd: GameDesignDocument, *, include_mermaid: bool = True, use_cache: bool = False
+) -> str:
+    """
+    Convert a GameDesignDocument to a beautifully styled HTML document.
+
+    The generated HTML includes:
+    - Hero section with game title and badges
+    - Sticky navigation bar
+    - Meta info cards (genres, platforms, audience, dev time)
+    - Core loop diagram with actions
+    - Systems tables and cards
+    - Progression timeline with milestones
+    - Narrative section with story and themes
+    - Character cards
+    - Technical specifications with performance targets
+    - Risk assessment table
+    - Map generation hints (if present)
+
+    The styling uses a dark theme with neon accents for a modern game design aesthetic.
+    All CSS is embedded for single-file distribution.
+
+    Args:
+        gdd: The GameDesignDocument to convert
+        include_mermaid: Whether to generate the Mermaid diagrams. Disable for
+            output that won't run JavaScript (PDF, email) to skip that work.
+        use_cache: Reuse the HTML of a recent identical document instead of
+            rendering again. Worth enabling for preview refreshes, which often
+            re-render an unchanged GDD; a miss costs an extra JSON dump.
+
+    Returns:
+        Complete HTML document as a string
+    """
+    if not use_cache:
+        return _render(gdd, include_mermaid)
+
+    # The JSON dump is only the lookup key; the caller's object is what gets
+    # rendered, so documents edited after validation render as before
+    key = (gdd.model_dump_json(), include_mermaid)
+    cached = _RENDER_CACHE.get(key)
+    if cached is not None:
+        _RENDER_CACHE.move_to_end(key)
+        return cached
+
+    rendered = _render(gdd, include_mermaid)
+    _RENDER_CACHE[key] = rendered
+    if len(_RENDER_CACHE) > _RENDER_CACHE_SIZE:
+        _RENDER_CACHE.popitem(last=False)
+    return rendered
+
+
+def gdd_to_html_bytes(
+    gdd: GameDesignDocument, *, include_mermaid: bool = True, use_cache: bool = False
+) -> bytes:
+    """
+    Convert a GameDesignDocument to a UTF-8 encoded HTML document.
+
+    Renders through gdd_to_html, so with use_cache an unchanged document is
+    served from the same render cache.
+
+    Args:
+        gdd: The GameDesignDocument to convert
+        include_mermaid: Whether to generate the Mermaid diagrams
+        use_cache: Reuse the HTML of a recent identical document (see gdd_to_html)
+
+    Returns:
+        Complete HTML document as UTF-8 bytes
+    """
+    return gdd_to_html(
+        gdd, include_mermaid=include_mermaid, use_cache=use_cache
+    ).encode("utf-8")
+
+
+def gdd_to_html_stream(
+    gdd: GameDesignDocument,
+    write: Callable[[str], object],
+    *,
+    include_mermaid: bool = True,
+) -> None:
+    """
+    Stream a GameDesignDocument as HTML to a writer, fragment by fragment.
+
+    Use this when the document goes straight to a file or a streaming HTTP
+    response, so the full HTML string never has to be held in memory.
+
+    Args:
+        gdd: The GameDesignDocument to convert
+        write: Called with each fragment in document order (e.g. ``file.write``)
+        include_mermaid: Whether to generate the Mermaid diagrams
+    """
+    _write_document(gdd, write, include_mermaid)
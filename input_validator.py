@@ -18,7 +18,9 @@ Usage:
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import zip_longest
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
@@ -47,16 +49,16 @@ class ValidationResult:
     missing_info: List[InfoCategory] = field(default_factory=list)
     detected_info: Dict[InfoCategory, str] = field(default_factory=dict)
     confidence_score: float = 0.0  # 0.0 ~ 1.0
+    # 각 질문이 묻는 카테고리 (questions와 같은 순서)
+    question_categories: list[InfoCategory] = field(default_factory=list)
 
     def get_follow_up_prompt(self) -> str:
         """추가 질문들을 포맷팅된 문자열로 반환"""
         if not self.questions:
             return ""
 
-        lines = ["다음 정보가 필요합니다:\n"]
-        for i, q in enumerate(self.questions, 1):
-            lines.append(f"{i}. {q}")
-        return "\n".join(lines)
+        numbered = [f"{i}. {q}" for i, q in enumerate(self.questions, 1)]
+        return "다음 정보가 필요합니다:\n\n" + "\n".join(numbered)
 
 
 # =============================================================================
@@ -203,6 +205,88 @@ MULTIPLAYER_KEYWORDS = {
 }
 
 
+# ============================================================================
+# 핵심 컨셉 / 독특한 특징 감지용 표현
+# ============================================================================
+# 게임 관련 동사나 명사
+GAME_VERBS = [
+    "키우",
+    "싸우",
+    "만들",
+    "수집",
+    "탐험",
+    "생존",
+    "달리",
+    "점프",
+    "쏘",
+    "방어",
+    "공격",
+    "해결",
+    "찾",
+    "모으",
+    "성장",
+    "관리",
+    "build",
+    "fight",
+    "collect",
+    "explore",
+    "survive",
+    "run",
+    "jump",
+    "shoot",
+    "defend",
+    "attack",
+    "solve",
+    "find",
+    "grow",
+    "manage",
+]
+
+# 특별한 메카닉이나 특징을 나타내는 표현
+UNIQUE_INDICATORS = [
+    "특별",
+    "독특",
+    "새로운",
+    "유니크",
+    "다른",
+    "특이",
+    "unique",
+    "special",
+    "new",
+    "different",
+    "twist",
+    "~이",
+    "~가",
+    "~를",
+    "~을",  # 구체적 명사를 수식하는 조사
+]
+
+# 구체적인 메카닉 설명 (예: "~하면 ~된다", "~을 통해").
+# ".+하면.+"와 같은 조건이지만 앞뒤 한 글자만 확인해 역추적이 없습니다
+MECHANIC_PATTERN = r".(?:하면|통해|으로).|.(?:기능|시스템)"
+
+
+def _compile_patterns(keyword_dict: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
+    """키워드를 정규식 패턴으로 컴파일 (소문자로 변환된 텍스트에 사용)"""
+    patterns = {}
+    for category, keywords in keyword_dict.items():
+        pattern = "|".join([re.escape(kw.lower()) for kw in keywords])
+        patterns[category] = re.compile(pattern)
+    return patterns
+
+
+# 추가 질문 응답을 프롬프트에 붙일 때 사용하는 카테고리별 이름
+ANSWER_LABELS = {
+    InfoCategory.GENRE: "장르",
+    InfoCategory.CORE_CONCEPT: "핵심 플레이",
+    InfoCategory.VIEW_PERSPECTIVE: "시점",  # 2D/3D
+    InfoCategory.ENGINE: "게임 엔진",
+    InfoCategory.PLATFORM: "플랫폼",
+    InfoCategory.MULTIPLAYER_TYPE: "플레이 유형",
+    InfoCategory.UNIQUE_FEATURE: "특징",
+}
+
+
 class InputValidator:
     """사용자 입력 검증기"""
 
@@ -218,23 +302,19 @@ class InputValidator:
         InfoCategory.ENGINE,  # 엔진 필수!
     ]
 
+    # 정규식은 클래스 정의 시 한 번만 컴파일되어 모든 인스턴스가 공유
+    genre_patterns = _compile_patterns(GENRE_KEYWORDS)
+    platform_patterns = _compile_patterns(PLATFORM_KEYWORDS)
+    art_style_patterns = _compile_patterns(ART_STYLE_KEYWORDS)
+    view_patterns = _compile_patterns(VIEW_PERSPECTIVE_KEYWORDS)
+    engine_patterns = _compile_patterns(ENGINE_KEYWORDS)
+    multiplayer_patterns = _compile_patterns(MULTIPLAYER_KEYWORDS)
+    core_verb_pattern = re.compile("|".join(map(re.escape, GAME_VERBS)))
+    unique_indicator_pattern = re.compile("|".join(map(re.escape, UNIQUE_INDICATORS)))
+    mechanic_pattern = re.compile(MECHANIC_PATTERN)
+
     def __init__(self):
-        self.genre_patterns = self._compile_patterns(GENRE_KEYWORDS)
-        self.platform_patterns = self._compile_patterns(PLATFORM_KEYWORDS)
-        self.art_style_patterns = self._compile_patterns(ART_STYLE_KEYWORDS)
-        self.view_patterns = self._compile_patterns(VIEW_PERSPECTIVE_KEYWORDS)
-        self.engine_patterns = self._compile_patterns(ENGINE_KEYWORDS)
-        self.multiplayer_patterns = self._compile_patterns(MULTIPLAYER_KEYWORDS)
-
-    def _compile_patterns(
-        self, keyword_dict: Dict[str, List[str]]
-    ) -> Dict[str, re.Pattern]:
-        """키워드를 정규식 패턴으로 컴파일"""
-        patterns = {}
-        for category, keywords in keyword_dict.items():
-            pattern = "|".join(re.escape(kw) for kw in keywords)
-            patterns[category] = re.compile(pattern, re.IGNORECASE)
-        return patterns
+        self._validate_cached = lru_cache(maxsize=256)(self._validate_lowered)
 
     def _detect_genre(self, text: str) -> Optional[str]:
         """장르 감지"""
@@ -286,86 +366,19 @@ class InputValidator:
             return False
 
         # 게임 관련 동사나 명사가 있는지
-        game_verbs = [
-            "키우",
-            "싸우",
-            "만들",
-            "수집",
-            "탐험",
-            "생존",
-            "달리",
-            "점프",
-            "쏘",
-            "방어",
-            "공격",
-            "해결",
-            "찾",
-            "모으",
-            "성장",
-            "관리",
-            "build",
-            "fight",
-            "collect",
-            "explore",
-            "survive",
-            "run",
-            "jump",
-            "shoot",
-            "defend",
-            "attack",
-            "solve",
-            "find",
-            "grow",
-            "manage",
-        ]
-
-        text_lower = text.lower()
-        for verb in game_verbs:
-            if verb in text_lower:
-                return True
+        if self.core_verb_pattern.search(text):
+            return True
 
         return len(words) >= 5  # 최소 5단어면 일단 컨셉 있다고 봄
 
     def _has_unique_feature(self, text: str) -> bool:
         """독특한 특징이 언급되었는지 확인"""
         # 특별한 메카닉이나 특징을 나타내는 표현
-        unique_indicators = [
-            "특별",
-            "독특",
-            "새로운",
-            "유니크",
-            "다른",
-            "특이",
-            "unique",
-            "special",
-            "new",
-            "different",
-            "twist",
-            "~이",
-            "~가",
-            "~를",
-            "~을",  # 구체적 명사를 수식하는 조사
-        ]
-
-        text_lower = text.lower()
-        for indicator in unique_indicators:
-            if indicator in text_lower:
-                return True
+        if self.unique_indicator_pattern.search(text):
+            return True
 
         # 구체적인 메카닉 설명이 있는지 (예: "~하면 ~된다", "~을 통해")
-        mechanic_patterns = [
-            r".+하면.+",
-            r".+통해.+",
-            r".+으로.+",
-            r".+기능",
-            r".+시스템",
-        ]
-
-        for pattern in mechanic_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
+        return self.mechanic_pattern.search(text) is not None
 
     def validate(self, user_prompt: str) -> ValidationResult:
         """
@@ -377,10 +390,6 @@ class InputValidator:
         Returns:
             ValidationResult: 검증 결과 (충분 여부, 질문 목록, 감지된 정보)
         """
-        detected_info: Dict[InfoCategory, str] = {}
-        missing_info: List[InfoCategory] = []
-        questions: List[str] = []
-
         # 입력이 너무 짧은 경우
         if len(user_prompt.strip()) < 5:
             return ValidationResult(
@@ -391,16 +400,37 @@ class InputValidator:
                 missing_info=[InfoCategory.CORE_CONCEPT],
                 detected_info={},
                 confidence_score=0.0,
+                question_categories=[InfoCategory.CORE_CONCEPT],
             )
 
+        # 모든 감지기는 한 번만 소문자로 변환한 텍스트를 사용하고, 같은 입력은
+        # 다시 분석하지 않음. 호출자가 결과를 수정해도 캐시가 바뀌지 않도록
+        # 복사본을 반환
+        result = self._validate_cached(user_prompt.lower())
+        return replace(
+            result,
+            questions=list(result.questions),
+            missing_info=list(result.missing_info),
+            detected_info=dict(result.detected_info),
+            question_categories=list(result.question_categories),
+        )
+
+    def _validate_lowered(self, text_lower: str) -> ValidationResult:
+        """소문자로 변환된 입력을 분석 (validate()에서 캐시를 거쳐 호출)"""
+        detected_info: Dict[InfoCategory, str] = {}
+        missing_info: List[InfoCategory] = []
+        questions: List[str] = []
+        question_categories: list[InfoCategory] = []
+
         # ================================================================
         # 1. 장르 감지 (필수)
         # ================================================================
-        genre = self._detect_genre(user_prompt)
+        genre = self._detect_genre(text_lower)
         if genre:
             detected_info[InfoCategory.GENRE] = genre
         else:
             missing_info.append(InfoCategory.GENRE)
+            question_categories.append(InfoCategory.GENRE)
             questions.append(
                 "🎮 [필수] 어떤 장르의 게임인가요? (예: 액션, RPG, 퍼즐, 플랫포머, 로그라이크, 슈팅 등)"
             )
@@ -408,10 +438,11 @@ class InputValidator:
         # ================================================================
         # 2. 핵심 컨셉 확인 (필수)
         # ================================================================
-        if self._has_core_concept(user_prompt):
+        if self._has_core_concept(text_lower):
             detected_info[InfoCategory.CORE_CONCEPT] = "detected"
         else:
             missing_info.append(InfoCategory.CORE_CONCEPT)
+            question_categories.append(InfoCategory.CORE_CONCEPT)
             questions.append(
                 "🎯 [필수] 게임의 핵심 플레이 방식은 무엇인가요? (예: 무엇을 하고, 어떻게 진행되나요?)"
             )
@@ -419,11 +450,12 @@ class InputValidator:
         # ================================================================
         # 3. 2D/3D 시점 감지 (필수!) - 새로 추가
         # ================================================================
-        view = self._detect_view_perspective(user_prompt)
+        view = self._detect_view_perspective(text_lower)
         if view:
             detected_info[InfoCategory.VIEW_PERSPECTIVE] = view
         else:
             missing_info.append(InfoCategory.VIEW_PERSPECTIVE)
+            question_categories.append(InfoCategory.VIEW_PERSPECTIVE)
             questions.append(
                 "🖼️ [필수] 게임의 시점은 무엇인가요? (예: 3D 1인칭, 3D 3인칭, 2D 사이드뷰, 2D 탑다운, 2.5D 이소메트릭)"
             )
@@ -431,11 +463,12 @@ class InputValidator:
         # ================================================================
         # 4. 게임 엔진 감지 (필수!) - 새로 추가
         # ================================================================
-        engine = self._detect_engine(user_prompt)
+        engine = self._detect_engine(text_lower)
         if engine:
             detected_info[InfoCategory.ENGINE] = engine
         else:
             missing_info.append(InfoCategory.ENGINE)
+            question_categories.append(InfoCategory.ENGINE)
             questions.append(
                 "🔧 [필수] 어떤 게임 엔진을 사용하나요? (예: Unity, Unreal, Godot, GameMaker, 웹/HTML5)"
             )
@@ -443,28 +476,28 @@ class InputValidator:
         # ================================================================
         # 5. 플랫폼 감지 (선택)
         # ================================================================
-        platform = self._detect_platform(user_prompt)
+        platform = self._detect_platform(text_lower)
         if platform:
             detected_info[InfoCategory.PLATFORM] = platform
 
         # ================================================================
         # 6. 아트 스타일 감지 (선택)
         # ================================================================
-        art_style = self._detect_art_style(user_prompt)
+        art_style = self._detect_art_style(text_lower)
         if art_style:
             detected_info[InfoCategory.ART_STYLE] = art_style
 
         # ================================================================
         # 7. 멀티플레이어 유형 감지 (선택) - 새로 추가
         # ================================================================
-        multiplayer = self._detect_multiplayer_type(user_prompt)
+        multiplayer = self._detect_multiplayer_type(text_lower)
         if multiplayer:
             detected_info[InfoCategory.MULTIPLAYER_TYPE] = multiplayer
 
         # ================================================================
         # 8. 독특한 특징 확인 (선택)
         # ================================================================
-        if self._has_unique_feature(user_prompt):
+        if self._has_unique_feature(text_lower):
             detected_info[InfoCategory.UNIQUE_FEATURE] = "detected"
 
         # ================================================================
@@ -498,10 +531,12 @@ class InputValidator:
         # 선택적 질문 추가 (필수가 충족되었지만 추가 정보 권장)
         if all_required_met and not is_sufficient:
             if InfoCategory.PLATFORM not in detected_info:
+                question_categories.append(InfoCategory.PLATFORM)
                 questions.append(
                     "📱 [권장] 타겟 플랫폼이 있나요? (예: PC, 모바일, 웹, 콘솔)"
                 )
             if InfoCategory.MULTIPLAYER_TYPE not in detected_info:
+                question_categories.append(InfoCategory.MULTIPLAYER_TYPE)
                 questions.append(
                     "👥 [권장] 싱글플레이인가요, 멀티플레이인가요? (예: 솔로, 로컬 협동, 온라인)"
                 )
@@ -512,6 +547,7 @@ class InputValidator:
             missing_info=missing_info,
             detected_info=detected_info,
             confidence_score=confidence_score,
+            question_categories=question_categories,
         )
 
     def enhance_prompt(
@@ -527,19 +563,24 @@ class InputValidator:
         Returns:
             보강된 프롬프트
         """
-        enhanced_parts = [original_prompt]
-
-        for key, value in additional_info.items():
-            if value.strip():
-                enhanced_parts.append(f"{key}: {value}")
-
-        return "\n".join(enhanced_parts)
+        # 빈 값과 공백뿐인 응답은 제외 (strip() 없이 검사)
+        return "\n".join(
+            [original_prompt]
+            + [
+                f"{key}: {value}"
+                for key, value in additional_info.items()
+                if value and not value.isspace()
+            ]
+        )
 
 
 # =============================================================================
 # CLI 통합용 헬퍼 함수
 # =============================================================================
 
+# 헬퍼 함수들이 공유하는 검증기 (같은 프롬프트의 검증 결과 캐시도 공유)
+_default_validator = InputValidator()
+
 
 def validate_and_ask(prompt: str, console: Any = None) -> tuple[bool, str]:
     """
@@ -552,7 +593,7 @@ def validate_and_ask(prompt: str, console: Any = None) -> tuple[bool, str]:
     Returns:
         (성공 여부, 최종 프롬프트 또는 에러 메시지)
     """
-    validator = InputValidator()
+    validator = _default_validator
     result = validator.validate(prompt)
 
     if result.is_sufficient:
@@ -586,7 +627,7 @@ def interactive_validate(prompt: str) -> str:
     Returns:
         보강된 최종 프롬프트
     """
-    validator = InputValidator()
+    validator = _default_validator
     result = validator.validate(prompt)
 
     if result.is_sufficient:
@@ -598,25 +639,13 @@ def interactive_validate(prompt: str) -> str:
     print("추가 정보가 필요합니다.")
     print("=" * 50 + "\n")
 
-    for question in result.questions:
+    # 카테고리가 없는 질문(직접 만든 ValidationResult 등)도 빠짐없이 묻고
+    # "추가 정보"로 분류
+    categories = result.question_categories[: len(result.questions)]
+    for question, category in zip_longest(result.questions, categories):
         answer = input(f"{question}\n> ").strip()
         if answer:
-            # 질문 키워드로 분류
-            if "장르" in question:
-                additional_info["장르"] = answer
-            elif "플레이" in question or "방식" in question:
-                additional_info["핵심 플레이"] = answer
-            elif "시점" in question or "2D" in question or "3D" in question:
-                additional_info["시점"] = answer  # 2D/3D
-            elif "엔진" in question:
-                additional_info["게임 엔진"] = answer
-            elif "플랫폼" in question:
-                additional_info["플랫폼"] = answer
-            elif "멀티" in question or "싱글" in question or "협동" in question:
-                additional_info["플레이 유형"] = answer
-            elif "특별" in question or "차별" in question:
-                additional_info["특징"] = answer
-            else:
-                additional_info["추가 정보"] = answer
+            # 질문 카테고리로 분류
+            additional_info[ANSWER_LABELS.get(category, "추가 정보")] = answer
 
     return validator.enhance_prompt(prompt, additional_info)
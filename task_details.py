@@ -5,6 +5,7 @@ This module provides comprehensive implementation specifications for all 33 task
 across 8 development phases, with clickable navigation from the sidebar checklist.
 """
 
+from functools import lru_cache
 from typing import Dict, List
 import html
 
@@ -1044,8 +1045,14 @@ TASK_SPECIFICATIONS = {
 }
 
 
+@lru_cache(maxsize=1)
 def generate_task_details_html() -> str:
-    """Generate HTML for all detailed task specifications."""
+    """
+    Generate HTML for all detailed task specifications.
+
+    Built only from the static TASK_SPECIFICATIONS, so it is rendered once
+    per process.
+    """
 
     # Group tasks by phase
     phases = {}
@@ -1173,6 +1180,8 @@ def generate_task_details_html() -> str:
     return "\n".join(html_parts)
 
 
+# The checklist phases and tasks are fixed, so the markup never changes
+@lru_cache(maxsize=1)
 def generate_sidebar_checklist_with_links() -> str:
     """Generate the sidebar checklist with clickable task links."""
 
@@ -26,7 +26,7 @@ from main import (
     gdd_to_map_hints_prompt,
     OutputFormat,
 )
-from html_template import gdd_to_html
+from html_template import gdd_to_html, gdd_to_html_bytes, gdd_to_html_stream
 from models import (
     GameDesignDocument,
     GameMeta,
@@ -658,6 +658,73 @@ class TestGddToHtml:
         assert "&lt;Game&gt;" in html
         assert "&amp;" in html
 
+    def test_html_systems_diagram_links_dependencies(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test system dependencies become Mermaid edges (case-insensitive)."""
+        gdd_dict = sample_gdd.model_dump()
+        gdd_dict["systems"][1]["dependencies"] = ["combat system", "Unknown System"]
+        gdd_dict["systems"][2]["dependencies"] = ["LOOT SYSTEM"]
+        gdd = GameDesignDocument.model_validate(gdd_dict)
+
+        html = gdd_to_html(gdd)
+        assert "S0 --> S1" in html
+        assert "S1 --> S2" in html
+        assert html.count(" --> S") == 2
+
+    def test_html_loads_mermaid_with_diagrams(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test the Mermaid script is included when a diagram is emitted."""
+        html = gdd_to_html(sample_gdd)
+        assert '<div class="mermaid">' in html
+        assert "mermaid.min.js" in html
+
+    def test_html_without_mermaid_skips_diagrams(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test include_mermaid=False omits diagrams but keeps the sections."""
+        html = gdd_to_html(sample_gdd, include_mermaid=False)
+        assert '<div class="mermaid">' not in html
+        assert "flowchart LR" not in html
+        assert "flowchart TB" not in html
+        assert "mermaid.min.js" not in html
+        assert 'id="core-loop"' in html
+        assert 'id="systems"' in html
+
+    def test_html_bytes_match_text_output(self, sample_gdd: GameDesignDocument) -> None:
+        """Test UTF-8 bytes output decodes to the same document as gdd_to_html."""
+        html_bytes = gdd_to_html_bytes(sample_gdd)
+        assert isinstance(html_bytes, bytes)
+        assert html_bytes.decode("utf-8") == gdd_to_html(sample_gdd)
+
+    def test_html_cache_tracks_document_changes(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test cached rendering matches a fresh render and sees model edits."""
+        assert gdd_to_html(sample_gdd, use_cache=True) == gdd_to_html(sample_gdd)
+        meta = sample_gdd.meta.model_copy(update={"title": "Renamed Quest"})
+        changed = sample_gdd.model_copy(update={"meta": meta})
+        assert "Renamed Quest" in gdd_to_html(changed, use_cache=True)
+
+    def test_html_cache_renders_mutated_document(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test a GDD edited after construction renders with and without cache."""
+        sample_gdd.systems = sample_gdd.systems[:2]
+        html = gdd_to_html(sample_gdd)
+        assert gdd_to_html(sample_gdd, use_cache=True) == html
+        assert gdd_to_html(sample_gdd, use_cache=True) == html
+
+    def test_html_stream_matches_text_output(
+        self, sample_gdd: GameDesignDocument
+    ) -> None:
+        """Test streamed fragments concatenate to the gdd_to_html document."""
+        chunks = []
+        gdd_to_html_stream(sample_gdd, chunks.append)
+        assert len(chunks) > 1
+        assert "".join(chunks) == gdd_to_html(sample_gdd)
+
     def test_html_is_non_empty_string(self, sample_gdd: GameDesignDocument) -> None:
         """Test HTML output is a substantial non-empty string."""
         html = gdd_to_html(sample_gdd)
@@ -0,0 +1,217 @@
+"""
+test_input_validator.py - Tests for the game concept input validator
+
+Tests cover:
+- Follow-up question categories
+- Validation result caching
+- Answer labels used by interactive validation
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import input_validator
+from input_validator import InfoCategory, InputValidator, ValidationResult
+
+# =============================================================================
+# FIXTURES
+# =============================================================================
+
+
+# All required categories present; no platform or multiplayer keywords
+COMPLETE_PROMPT = "유니티 3D 액션 게임, 몬스터를 사냥하는 전투"
+
+
+@pytest.fixture
+def validator() -> InputValidator:
+    """Fresh validator with an empty result cache."""
+    return InputValidator()
+
+
+@pytest.fixture
+def strict_validator() -> InputValidator:
+    """Validator that asks the recommended questions once required info is met."""
+    validator = InputValidator()
+    validator.MIN_SUFFICIENT_SCORE = 0.95
+    return validator
+
+
+# =============================================================================
+# QUESTION CATEGORY TESTS
+# =============================================================================
+
+
+class TestQuestionCategories:
+    """Test that question_categories lines up with questions."""
+
+    def test_short_input(self, validator):
+        """Test the short-input early return asks about the core concept."""
+        result = validator.validate("abc")
+        assert len(result.questions) == 1
+        assert result.question_categories == [InfoCategory.CORE_CONCEPT]
+
+    def test_all_required_missing(self, validator):
+        """Test each missing required category gets its own question."""
+        result = validator.validate("아무거나 좋아요 정말로")
+        assert result.question_categories == [
+            InfoCategory.GENRE,
+            InfoCategory.CORE_CONCEPT,
+            InfoCategory.VIEW_PERSPECTIVE,
+            InfoCategory.ENGINE,
+        ]
+        assert result.question_categories == result.missing_info
+        assert len(result.questions) == len(result.question_categories)
+
+    def test_partially_missing(self, validator):
+        """Test detected categories are not asked about."""
+        result = validator.validate("godot으로 만드는 퍼즐")
+        assert result.question_categories == [
+            InfoCategory.CORE_CONCEPT,
+            InfoCategory.VIEW_PERSPECTIVE,
+        ]
+        assert "[필수] 게임의 핵심 플레이" in result.questions[0]
+        assert "[필수] 게임의 시점" in result.questions[1]
+
+    def test_recommended_questions(self, strict_validator):
+        """Test recommended questions are tagged with their categories."""
+        result = strict_validator.validate(COMPLETE_PROMPT)
+        assert result.missing_info == []
+        assert result.question_categories == [
+            InfoCategory.PLATFORM,
+            InfoCategory.MULTIPLAYER_TYPE,
+        ]
+        assert "플랫폼" in result.questions[0]
+        assert "멀티플레이" in result.questions[1]
+
+    def test_sufficient_input(self, validator):
+        """Test a sufficient prompt has no questions or categories."""
+        result = validator.validate(COMPLETE_PROMPT)
+        assert result.is_sufficient
+        assert result.questions == []
+        assert result.question_categories == []
+
+
+# =============================================================================
+# RESULT CACHE TESTS
+# =============================================================================
+
+
+class TestValidationCache:
+    """Test the per-instance validation result cache."""
+
+    def test_repeated_prompt_is_cache_hit(self, validator):
+        """Test validating the same prompt again reuses the analysis."""
+        first = validator.validate("아무거나 좋아요 정말로")
+        second = validator.validate("아무거나 좋아요 정말로")
+
+        info = validator._validate_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert second == first
+
+    def test_cache_is_keyed_on_lowercased_prompt(self, validator):
+        """Test prompts differing only in case share one cache entry."""
+        validator.validate("Unity 3D puzzle game where you rotate blocks")
+        validator.validate("UNITY 3D PUZZLE GAME WHERE YOU ROTATE BLOCKS")
+
+        assert validator._validate_cached.cache_info().hits == 1
+
+    def test_short_input_skips_cache(self, validator):
+        """Test the short-input early return doesn't touch the cache."""
+        validator.validate("abc")
+        assert validator._validate_cached.cache_info().currsize == 0
+
+    def test_results_are_copies(self, validator):
+        """Test mutating a returned result doesn't change later results."""
+        expected = InputValidator().validate("godot으로 만드는 퍼즐")
+
+        result = validator.validate("godot으로 만드는 퍼즐")
+        result.questions.append("extra")
+        result.missing_info.clear()
+        result.detected_info[InfoCategory.PLATFORM] = "PC"
+        result.question_categories.reverse()
+
+        assert validator.validate("godot으로 만드는 퍼즐") == expected
+        assert validator._validate_cached.cache_info().hits == 1
+
+
+# =============================================================================
+# INTERACTIVE VALIDATION TESTS
+# =============================================================================
+
+
+class TestInteractiveValidate:
+    """Test the labels interactive_validate files answers under."""
+
+    @pytest.fixture
+    def collected(self, monkeypatch):
+        """Capture the additional_info passed to enhance_prompt."""
+        collected = {}
+        enhance_prompt = InputValidator.enhance_prompt
+
+        def spy(self, original_prompt, additional_info):
+            collected.update(additional_info)
+            return enhance_prompt(self, original_prompt, additional_info)
+
+        monkeypatch.setattr(InputValidator, "enhance_prompt", spy)
+        return collected
+
+    @staticmethod
+    def answer_with(monkeypatch, answers):
+        """Feed the given answers to input() in order."""
+        replies = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(replies))
+
+    def test_required_answers(self, monkeypatch, capsys, collected):
+        """Test answers to required questions use the category labels."""
+        self.answer_with(monkeypatch, ["로그라이크", "던전 탐험", "2D 탑다운", ""])
+        enhanced = input_validator.interactive_validate("아무거나 좋아요 정말로")
+
+        assert collected == {
+            "장르": "로그라이크",
+            "핵심 플레이": "던전 탐험",
+            "시점": "2D 탑다운",
+        }
+        assert enhanced.endswith("시점: 2D 탑다운")
+
+    def test_short_input_answer(self, monkeypatch, capsys, collected):
+        """Test the short-input answer is filed as the core concept."""
+        self.answer_with(monkeypatch, ["  블록을 쌓는 퍼즐  "])
+        input_validator.interactive_validate("abc")
+
+        assert collected == {"핵심 플레이": "블록을 쌓는 퍼즐"}
+
+    def test_recommended_answers(
+        self, monkeypatch, capsys, collected, strict_validator
+    ):
+        """Test the multiplayer answer is filed under its own label."""
+        monkeypatch.setattr(input_validator, "_default_validator", strict_validator)
+        self.answer_with(monkeypatch, ["PC", "온라인 협동"])
+        input_validator.interactive_validate(COMPLETE_PROMPT)
+
+        assert collected == {"플랫폼": "PC", "플레이 유형": "온라인 협동"}
+
+    def test_sufficient_prompt_not_asked(self, monkeypatch, collected):
+        """Test a sufficient prompt is returned without asking anything."""
+        self.answer_with(monkeypatch, [])
+        assert input_validator.interactive_validate(COMPLETE_PROMPT) == COMPLETE_PROMPT
+        assert collected == {}
+
+    def test_uncategorised_questions(self, monkeypatch, capsys, collected):
+        """Test questions without categories are still asked."""
+        result = ValidationResult(
+            is_sufficient=False,
+            questions=["어떤 게임인가요?", "누구를 위한 게임인가요?"],
+        )
+        monkeypatch.setattr(
+            input_validator._default_validator, "validate", lambda prompt: result
+        )
+        self.answer_with(monkeypatch, ["", "아이들"])
+        enhanced = input_validator.interactive_validate("직접 만든 결과")
+
+        assert collected == {"추가 정보": "아이들"}
+        assert enhanced == "직접 만든 결과\n추가 정보: 아이들"
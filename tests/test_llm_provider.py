@@ -223,6 +223,41 @@ class TestParseJsonResponse:
         with pytest.raises(ValueError, match="Invalid JSON"):
             parse_json_response("```json\n{invalid}\n```")
 
+    def test_parse_without_orjson(self, monkeypatch):
+        """Test that parsing falls back to the stdlib json module."""
+        import llm_provider
+
+        monkeypatch.setattr(llm_provider, "orjson", None)
+        assert parse_json_response('{"key": [1, 2]}') == {"key": [1, 2]}
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            parse_json_response("{invalid}")
+
+    def test_parse_with_orjson(self):
+        """Test that plain JSON is parsed by orjson when it is installed."""
+        orjson = pytest.importorskip("orjson")
+
+        with patch("llm_provider.orjson.loads", wraps=orjson.loads) as loads:
+            result = parse_json_response('```json\n{"key": [1, 2]}\n```')
+        assert result == {"key": [1, 2]}
+        loads.assert_called_once_with('{"key": [1, 2]}')
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": "\\ud83d"}',
+            '{"a": 18446744073709551616}',
+            '{"a": -9223372036854775809}',
+            '{"a": 1e400}',
+            '{"a": NaN}',
+        ],
+    )
+    def test_parse_matches_stdlib_json(self, text):
+        """Test that results don't depend on whether orjson is installed."""
+        pytest.importorskip("orjson")
+        result = parse_json_response(text)
+        expected = json.loads(text)
+        assert repr(result) == repr(expected)
+
 
 class TestParseToModel:
     """Tests for Pydantic model parsing."""